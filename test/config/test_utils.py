@@ -0,0 +1,28 @@
+import os
+import tempfile
+from pathlib import Path
+
+from tsdat.config.utils import read_yaml
+
+
+def test_read_yaml_returns_independent_copies():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "config.yaml"
+        filepath.write_text("attrs:\n  title: Example\n")
+
+        config = read_yaml(filepath)
+        config["attrs"]["title"] = "Modified"
+
+        assert read_yaml(filepath) == {"attrs": {"title": "Example"}}
+
+
+def test_read_yaml_picks_up_file_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "config.yaml"
+        filepath.write_text("value: 1\n")
+        assert read_yaml(filepath) == {"value": 1}
+
+        filepath.write_text("value: 22\n")
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert read_yaml(filepath) == {"value": 22}
@@ -1,13 +1,17 @@
+import numpy as np
 import pandas as pd
+import pytest
 import xarray as xr
 from pathlib import Path
 from pytest import fixture
+from act.utils.data_utils import convert_units  # type: ignore
 from tsdat import (
     DatasetConfig,
     StringToDatetime,
     UnitsConverter,
     RetrievedDataset,
 )
+from tsdat.io.converters import _convert_units, _get_linear_conversion
 
 
 @fixture
@@ -116,3 +120,47 @@ def test_stringtime_converter(
     )
     assert data is not None
     assert (data.data - pd.Timedelta(hours=7) == expected.time.data).all()
+
+
+def test_retrieved_dataset_mappings_are_lazy(sample_dataset: xr.Dataset):
+    retrieved_dataset = RetrievedDataset.from_xr_dataset(sample_dataset)
+    data_vars = retrieved_dataset.data_vars
+
+    assert list(data_vars) == ["first", "second"]
+    assert len(data_vars) == 2 and "first" in data_vars
+    assert not data_vars._data  # type: ignore  # nothing is built until accessed
+    assert data_vars["first"] is data_vars["first"]
+    assert data_vars["first"].equals(sample_dataset["first"])
+
+    # Assigned values take precedence over the dataset's variables
+    data_vars["second"] = sample_dataset["first"]
+    assert data_vars["second"].equals(sample_dataset["first"])
+    data_vars["third"] = sample_dataset["second"]
+    assert list(data_vars) == ["first", "second", "third"]
+
+    del data_vars["first"]
+    assert "first" not in data_vars
+    assert list(data_vars) == ["second", "third"]
+
+    copied = data_vars.copy()
+    assert isinstance(copied, dict) and list(copied) == ["second", "third"]
+    assert list(retrieved_dataset.coords) == ["time"]
+
+
+@pytest.mark.parametrize(
+    ("data", "in_units", "out_units", "affine"),
+    (
+        (np.array([32.0, 212.0, -40.0]), "degF", "degC", True),  # offset conversion
+        (np.array([1, 2, 3]), "km", "m", True),  # int data round-trips to int
+        (np.array([1, 2, 3]), "m", "km", True),  # int data converted to float
+        (np.array([0.0, 10.0, 20.0]), "dB", "dimensionless", False),  # pint fallback
+    ),
+)
+def test_convert_units_matches_act(
+    data: np.ndarray, in_units: str, out_units: str, affine: bool  # type: ignore
+):
+    expected = convert_units(data.copy(), in_units, out_units)
+    converted = _convert_units(data.copy(), in_units, out_units)
+    assert (_get_linear_conversion(in_units, out_units) is not None) == affine
+    assert converted.dtype == expected.dtype
+    assert np.allclose(converted, expected, rtol=1e-9, atol=1e-9)
@@ -143,6 +143,18 @@ def test_simple_extract_multifile_dataset(
     assert_close(dataset, expected)
 
 
+def test_concurrent_reads_match_sequential_reads(simple_retriever: DefaultRetriever):
+    input_keys = ["test/io/data/input.csv", "test/io/data/input_extended.csv"]
+    expected = simple_retriever._get_raw_mapping(input_keys)
+
+    simple_retriever.parameters.max_workers = 2
+    raw_mapping = simple_retriever._get_raw_mapping(input_keys)
+
+    assert list(raw_mapping) == list(expected) == input_keys
+    for key, dataset in raw_mapping.items():
+        assert_close(dataset, expected[key])
+
+
 @pytest.mark.requires_adi
 def test_storage_retriever(
     storage_retriever: StorageRetriever, vap_dataset_config: DatasetConfig
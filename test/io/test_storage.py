@@ -1,9 +1,10 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import time
-from typing import Any
+from typing import Any, List
 
 import moto
 import numpy as np
@@ -169,6 +170,37 @@ def test_fetch_returns_empty(
     assert_close(dataset, expected_dataset)
 
 
+def test_s3_bucket_resource_is_cached_per_thread(s3_storage: FileSystemS3):
+    assert s3_storage._bucket is s3_storage._bucket  # type: ignore
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(lambda: s3_storage._bucket).result()  # type: ignore
+    assert other is not s3_storage._bucket  # type: ignore
+    assert other.name == s3_storage._bucket.name  # type: ignore
+
+
+def test_s3_save_ancillary_files_uses_save_ancillary_file(
+    s3_storage: FileSystemS3,
+    sample_dataset: xr.Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    saved: List[Path] = []
+    save_ancillary_file = FileSystemS3.save_ancillary_file
+
+    def save_and_record(self: FileSystemS3, filepath: Path, target_path: Path):
+        saved.append(target_path)
+        save_ancillary_file(self, filepath, target_path)
+
+    monkeypatch.setattr(FileSystemS3, "save_ancillary_file", save_and_record)
+    with s3_storage.uploadable_dir() as tmp_dir:
+        for i in range(3):
+            s3_storage.get_ancillary_filepath(
+                title=f"plot_{i}", dataset=sample_dataset, root_dir=tmp_dir
+            ).touch()
+
+    assert len(saved) == 3
+    assert all(s3_storage._exists(target) for target in saved)  # type: ignore
+
+
 def test_last_modified(s3_storage: FileSystemS3, sample_dataset: xr.Dataset):
     # Should be empty at first
     datastream = sample_dataset.attrs["datastream"]
@@ -300,3 +332,54 @@ def test_storage_saves_ancillary_files(
     else:
         assert expected_filepath.exists()
         os.remove(expected_filepath)
+
+
+def test_storage_saves_only_registered_ancillary_files(
+    file_storage: FileSystem, sample_dataset: xr.Dataset
+):
+    with file_storage.uploadable_dir() as tmp_dir:
+        registered = file_storage.get_ancillary_filepath(
+            title="registered", dataset=sample_dataset, root_dir=tmp_dir
+        )
+        unregistered = file_storage.get_ancillary_filepath(
+            title="unregistered", dataset=sample_dataset, root_dir=tmp_dir
+        )
+        registered.touch()
+        unregistered.touch()
+        file_storage.register_ancillary_file(registered)
+
+    storage_root = file_storage.parameters.storage_root
+    assert (storage_root / registered.relative_to(tmp_dir)).exists()
+    assert not (storage_root / unregistered.relative_to(tmp_dir)).exists()
+
+    with pytest.raises(RuntimeError):
+        file_storage.register_ancillary_file(registered)
+
+    with pytest.raises(ValueError):
+        with file_storage.uploadable_dir() as tmp_dir:
+            file_storage.register_ancillary_file(storage_root / "outside.png")
+    assert not tmp_dir.exists()
+
+
+@pytest.mark.parametrize("storage_fixture", ["file_storage", "s3_storage"])
+def test_storage_saves_many_ancillary_files(
+    storage_fixture: str, sample_dataset: xr.Dataset, request: pytest.FixtureRequest
+):
+    storage: Storage = request.getfixturevalue(storage_fixture)
+
+    with storage.uploadable_dir() as tmp_dir:
+        filepaths = [
+            storage.get_ancillary_filepath(
+                title=f"plot_{i}", dataset=sample_dataset, root_dir=tmp_dir
+            )
+            for i in range(5)
+        ]
+        for filepath in filepaths:
+            filepath.touch()
+
+    for filepath in filepaths:
+        target = storage.parameters.storage_root / filepath.relative_to(tmp_dir)
+        if storage_fixture == "s3_storage":
+            assert storage._exists(target)  # type: ignore
+        else:
+            assert target.exists()
@@ -75,6 +75,20 @@ def test_ingest_pipeline():
     assert plot_path.exists()
 
 
+def test_dataset_dtypes_do_not_share_read_only_buffers():
+    config = PipelineConfig.from_yaml(Path("test/config/yaml/pipeline.yaml"))
+    pipeline = config.instantiate_pipeline()
+    dtype = pipeline.dataset_config["first"].dtype
+
+    data = np.array([1.0, 2.0, 3.0], dtype=dtype)
+    data.flags.writeable = False
+    dataset = xr.Dataset(data_vars={"first": ("time", data)})
+
+    dataset = pipeline._add_dataset_dtypes(dataset)  # type: ignore
+    dataset["first"].values[0] = 0  # in-place writes must not raise
+    assert data[0] == 1.0
+
+
 @pytest.mark.requires_adi
 def test_transformation_pipeline():
     expected = xr.Dataset(
@@ -168,6 +168,19 @@ def test_valid_delta():
     assert np.array_equal(results, expected)  # type: ignore
 
 
+def test_range_checks_accept_array_attrs():
+    # Range attributes read back from netCDF files are numpy arrays, not lists
+    ds = xr.Dataset(
+        data_vars={
+            "temperature": ("time", np.array([1.0, 5.0, 10.0]), {"valid_range": np.array([2, 8])}),  # type: ignore
+        },
+    )
+    min_results = CheckValidRangeMin().run(ds, "temperature")
+    max_results = CheckValidRangeMax().run(ds, "temperature")
+    assert np.array_equal(min_results, [True, False, False])  # type: ignore
+    assert np.array_equal(max_results, [False, False, True])  # type: ignore
+
+
 def test_monotonic_check_ignores_string_vars(
     sample_dataset_2D: xr.Dataset, caplog: Any
 ):
@@ -180,6 +193,34 @@ def test_monotonic_check_ignores_string_vars(
     )
 
 
+@pytest.mark.parametrize("require_decreasing", [False, True])
+def test_monotonic_1D_matches_running_comparison(require_decreasing: bool):
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.normal(0.5, 1.0, size=200))
+    values = -values if require_decreasing else values
+    values[rng.integers(0, values.size, size=10)] = np.nan
+    ds = xr.Dataset(coords={"index": np.arange(values.size)})
+    ds["data"] = ("index", values)
+
+    # Each value is compared against the most recent value that passed the check
+    expected = np.full(values.shape, False)
+    prev = values[0]
+    for i, value in enumerate(values[1:], start=1):
+        if (value < prev) if require_decreasing else (value > prev):
+            prev = value
+        else:
+            expected[i] = True
+
+    parameters = CheckMonotonic.Parameters(require_decreasing=require_decreasing)
+    failures = CheckMonotonic(parameters=parameters).run(ds, "data")
+    assert np.array_equal(failures, expected)  # type: ignore
+
+    ds["data"].data[0] = np.nan
+    failures = CheckMonotonic(parameters=parameters).run(ds, "data")
+    expected = [False] + [True] * (values.size - 1)
+    assert np.array_equal(failures, expected)  # type: ignore
+
+
 def test_monotonic_with_2D_vars(sample_dataset_2D: xr.Dataset, caplog: Any):
     with caplog.at_level(logging.WARNING):
         failures = CheckMonotonic().run(sample_dataset_2D, "wind_speed")
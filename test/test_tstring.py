@@ -143,6 +143,13 @@ def test_manual_regex_extraction():
     assert template.extract_substitutions(formatted) == expected
 
 
+def test_repeated_variable_substitution():
+    template = Template("{datastream}/{year}/{datastream}.{year}{month}")
+    assert template.substitute(datastream="a.b.c", year="2022", month="01") == (
+        "a.b.c/2022/a.b.c.202201"
+    )
+
+
 def test_repr():
     template = Template("{a}{b}{c}")
     assert repr(template) == "Template('{a}{b}{c}')"
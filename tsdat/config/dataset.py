@@ -19,6 +19,8 @@ __all__ = ["DatasetConfig"]
 
 logger = logging.getLogger(__name__)
 
+_VARIABLE_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_\(\)\/\[\]\{\}\.]+$")
+
 
 class DatasetConfig(YamlModel, extra=Extra.forbid):
     """---------------------------------------------------------------------------------
@@ -73,11 +75,10 @@ class DatasetConfig(YamlModel, extra=Extra.forbid):
         cls, vars: Dict[str, Variable], field: ModelField
     ) -> Dict[str, Variable]:
         for name in vars.keys():
-            pattern = re.compile(r"^[a-zA-Z0-9_\(\)\/\[\]\{\}\.]+$")
-            if not pattern.match(name):
+            if not _VARIABLE_NAME_PATTERN.match(name):
                 raise ValueError(
                     f"'{name}' is not a valid '{field.name}' name. It must be a value"
-                    f" matched by {pattern}."
+                    f" matched by {_VARIABLE_NAME_PATTERN}."
                 )
         return vars
 
@@ -24,6 +24,13 @@ from ..pipeline.base import Pipeline
 
 __all__ = ["PipelineConfig"]
 
+_OBJECT_FIELD_MAPPING: Dict[str, Any] = {
+    "retriever": RetrieverConfig,
+    "dataset": DatasetConfig,
+    "quality": QualityConfig,
+    "storage": StorageConfig,
+}
+
 
 class PipelineConfig(ParameterizedConfigClass, YamlModel, extra=Extra.allow):
     """---------------------------------------------------------------------------------
@@ -94,13 +101,7 @@ class PipelineConfig(ParameterizedConfigClass, YamlModel, extra=Extra.allow):
     def merge_overrideable_yaml(
         cls, v: Dict[str, Any], values: Dict[str, Any], field: ModelField
     ):
-        object_field_mapping = {
-            "retriever": RetrieverConfig,
-            "dataset": DatasetConfig,
-            "quality": QualityConfig,
-            "storage": StorageConfig,
-        }
-        config_cls = object_field_mapping[field.name]
+        config_cls = _OBJECT_FIELD_MAPPING[field.name]
 
         if matches_overrideable_schema(v):
             defaults = read_yaml(Path(v["path"]))
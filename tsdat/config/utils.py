@@ -1,6 +1,8 @@
+import copy
 import os
 import yaml
 import warnings
+from functools import lru_cache
 from jsonpointer import set_pointer  # type: ignore
 from dunamai import Style, Version
 from pathlib import Path
@@ -28,6 +30,11 @@ from typing import (
     TypeVar,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 
 __all__ = [
     "ParameterizedConfigClass",
@@ -242,7 +249,40 @@ def find_duplicates(entries: Sequence[_NamedClass]) -> List[str]:
 
 
 def read_yaml(filepath: Path) -> Dict[Any, Any]:
-    return list(yaml.safe_load_all(filepath.read_text(encoding="UTF-8")))[0]
+    """---------------------------------------------------------------------------------
+    Reads the first document from a yaml file.
+
+    Parsed files are cached using their absolute path, modification time, and size, so
+    repeated reads of an unchanged file (e.g., a storage config shared by several
+    pipelines) skip the yaml parser entirely. The returned dictionary is a deep copy of
+    the cached value, so it is safe for callers to modify it.
+
+    Args:
+        filepath (Path): The path to the yaml file.
+
+    Returns:
+        Dict[Any, Any]: The contents of the first yaml document in the file.
+
+    ---------------------------------------------------------------------------------"""
+    filepath = Path(filepath).absolute()
+    stat = filepath.stat()
+    config = _read_yaml_cached(filepath, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(filepath: Path, mtime: int, size: int) -> Dict[Any, Any]:
+    # mtime and size are only used as part of the cache key so that changes to the file
+    # invalidate previously-cached results.
+    del mtime, size
+    # Only the first document is used, so stop parsing once it has been loaded
+    # instead of materializing every document in the file.
+    # Passing bytes lets libyaml decode the UTF-8 input itself rather than first
+    # decoding the whole file into a Python str.
+    content = filepath.read_bytes()
+    for document in yaml.load_all(content, Loader=_YamlLoader):
+        return document
+    raise ValueError(f"No yaml documents found in '{filepath}'.")
 
 
 def get_code_version() -> str:
@@ -7,7 +7,11 @@ from typing import (
     Any,
     Dict,
     Generator,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
+    MutableMapping,
     NamedTuple,
     Optional,
     Pattern,
@@ -16,7 +20,7 @@ from typing import (
 )
 
 import xarray as xr
-from pydantic import BaseModel, BaseSettings, Extra, Field, validator
+from pydantic import BaseModel, BaseSettings, Extra, Field, PrivateAttr, validator
 from pydantic.fields import ModelField
 
 from ..config.dataset import DatasetConfig
@@ -26,6 +30,7 @@ from ..utils import (
     datetime_substitutions,
     get_fields_from_dataset,
     get_fields_from_datastream,
+    iter_files,
 )
 
 __all__ = [
@@ -47,19 +52,60 @@ InputKey = str
 VarName = str
 
 
+class _LazyDataArrays(MutableMapping[VarName, xr.DataArray]):
+    """Dict-like mapping of variable names to DataArrays from a dataset.
+
+    DataArrays are only built from the dataset (and then cached) when they are first
+    accessed, so variables that are never looked up cost nothing. Assigned values take
+    precedence over the dataset's variables, as they would in a regular dict."""
+
+    def __init__(self, dataset: xr.Dataset, names: Iterable[Hashable]) -> None:
+        self._dataset = dataset
+        self._names: Dict[VarName, Hashable] = {str(name): name for name in names}
+        self._data: Dict[VarName, xr.DataArray] = {}
+
+    def __getitem__(self, key: VarName) -> xr.DataArray:
+        if key not in self._data:
+            self._data[key] = self._dataset[self._names[key]]
+        return self._data[key]
+
+    def __setitem__(self, key: VarName, value: xr.DataArray) -> None:
+        self._names.setdefault(key, key)
+        self._data[key] = value
+
+    def __delitem__(self, key: VarName) -> None:
+        del self._names[key]
+        self._data.pop(key, None)
+
+    def __iter__(self) -> Iterator[VarName]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def copy(self) -> Dict[VarName, xr.DataArray]:
+        return dict(self.items())
+
+
 class RetrievedDataset(NamedTuple):
-    """Maps variable names to the input DataArray the data are retrieved from."""
+    """Maps variable names to the input DataArray the data are retrieved from.
 
-    coords: Dict[VarName, xr.DataArray]
-    data_vars: Dict[VarName, xr.DataArray]
+    Note that the coords and data_vars mappings are dict-like, but are not dict
+    instances when built using from_xr_dataset()."""
+
+    coords: MutableMapping[VarName, xr.DataArray]
+    data_vars: MutableMapping[VarName, xr.DataArray]
 
     # data_vars: Dict[VarName, Tuple[xr.Dataset, xr.DataArray]]  # (input dataset, output dataset)
     # def get_output_dataset(self, variable_name: str) -> xr.DataArray
 
     @classmethod
     def from_xr_dataset(cls, dataset: xr.Dataset):
-        coords = {str(name): data for name, data in dataset.coords.items()}
-        data_vars = {str(name): data for name, data in dataset.data_vars.items()}
+        coords = _LazyDataArrays(dataset, dataset.coords)
+        data_vars = _LazyDataArrays(dataset, dataset.data_vars)
         return cls(coords=coords, data_vars=data_vars)
 
 
@@ -393,6 +439,9 @@ class Storage(ParameterizedClass, ABC):
     handler: DataHandler
     """Defines methods for reading and writing datasets from the storage area."""
 
+    _uploadable_dirpath: Optional[Path] = PrivateAttr(default=None)
+    _registered_ancillary_files: Optional[List[Path]] = PrivateAttr(default=None)
+
     def last_modified(self, datastream: str) -> Union[datetime, None]:
         """Find the last modified time for any data in that datastream.
 
@@ -578,6 +627,20 @@ class Storage(ParameterizedClass, ABC):
         """
         ...
 
+    def save_ancillary_files(self, filepaths: Dict[Path, Path]):
+        """Saves several ancillary files to the storage area.
+
+        Called by ``uploadable_dir()`` with all of the files to save at once. The
+        default implementation calls ``save_ancillary_file()`` for each file in turn;
+        subclasses may override this to upload files in batches or concurrently.
+
+        Args:
+            filepaths (Dict[Path, Path]): A mapping of paths to ancillary files to the
+                target paths where they should be saved.
+        """
+        for filepath, target_path in filepaths.items():
+            self.save_ancillary_file(filepath, target_path=target_path)
+
     @contextlib.contextmanager
     def uploadable_dir(self, **kwargs: Any) -> Generator[Path, None, None]:
         """Context manager that can be used to upload many ancillary files at once.
@@ -605,6 +668,10 @@ class Storage(ParameterizedClass, ABC):
             plt.close(fig)
         ```
 
+        If the files written to the temporary directory are registered using the
+        ``register_ancillary_file()`` method, then only those files are saved and the
+        temporary directory does not need to be searched for files to upload.
+
         Args:
             kwargs (Any): Unused. Included for backwards compatibility.
 
@@ -614,18 +681,58 @@ class Storage(ParameterizedClass, ABC):
         tmp_dir = tempfile.TemporaryDirectory()
         tmp_dirpath = Path(tmp_dir.name)
 
-        yield tmp_dirpath
-
-        for path in tmp_dirpath.glob("**/*"):
-            if path.is_file():
-                # Users are expected to call self.get_ancillary_filename() with
-                # root_dir=tmp_dir (yield value from this function) or save files to
-                # tmp_dir / filename (using root_dir=None, the default, for
-                # get_ancillary_filename()).
-                #
-                # With these assumptions, we can get the target filepath by replacing
-                # tmp_dir with self.parameters.storage_root
-                target = self.parameters.storage_root / path.relative_to(tmp_dirpath)
-                self.save_ancillary_file(path, target_path=target)
-
-        tmp_dir.cleanup()
+        parent_dirpath = self._uploadable_dirpath
+        parent_registry = self._registered_ancillary_files
+        self._uploadable_dirpath = tmp_dirpath
+        self._registered_ancillary_files = registered = []
+        try:
+            try:
+                yield tmp_dirpath
+            finally:
+                self._uploadable_dirpath = parent_dirpath
+                self._registered_ancillary_files = parent_registry
+
+            if registered:
+                paths: List[Path] = list(dict.fromkeys(registered))
+            else:
+                paths = list(iter_files(tmp_dirpath))
+
+            # Users are expected to call self.get_ancillary_filename() with
+            # root_dir=tmp_dir (yield value from this function) or save files to
+            # tmp_dir / filename (using root_dir=None, the default, for
+            # get_ancillary_filename()).
+            #
+            # With these assumptions, we can get the target filepath by replacing
+            # tmp_dir with self.parameters.storage_root
+            storage_root = self.parameters.storage_root
+            self.save_ancillary_files(
+                {path: storage_root / path.relative_to(tmp_dirpath) for path in paths}
+            )
+        finally:
+            tmp_dir.cleanup()
+
+    def register_ancillary_file(self, filepath: Path):
+        """Registers a file written to the active ``uploadable_dir()`` for upload.
+
+        Registering files is optional. If any files are registered, then only those
+        files are saved when the ``uploadable_dir()`` context manager exits; otherwise
+        the whole temporary directory is searched for files to save.
+
+        Args:
+            filepath (Path): The path to the ancillary file. This must be located under
+                the temporary directory yielded by ``uploadable_dir()``.
+        """
+        if self._registered_ancillary_files is None or self._uploadable_dirpath is None:
+            raise RuntimeError(
+                "Ancillary files can only be registered inside of an uploadable_dir()"
+                " context."
+            )
+        filepath = Path(filepath)
+        try:
+            filepath.relative_to(self._uploadable_dirpath)
+        except ValueError:
+            raise ValueError(
+                f"Cannot register ancillary file '{filepath}' because it is not located"
+                f" under the uploadable_dir() path '{self._uploadable_dirpath}'."
+            )
+        self._registered_ancillary_files.append(filepath)
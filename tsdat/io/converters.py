@@ -3,11 +3,12 @@
 # IDEA: Use the flyweight pattern to limit memory usage if identical converters would
 # be created.
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import act  # type: ignore
 import numpy as np
 import pandas as pd
+import pint
 import xarray as xr
 from numpy.typing import NDArray
 from pydantic import validator
@@ -31,6 +32,95 @@ logger = logging.getLogger(__name__)
 # IDEA: "@data_converter()" decorator so DataConverters can be defined as functions in
 # user code. Arguments to data_converter can be parameters to the class.
 
+# Unit strings that pint does not understand, mapped to their pint equivalents. These
+# are the same fixes applied by act.utils.data_utils.convert_units.
+_UNIT_ALIASES = {
+    "C": "degC",
+    "F": "degF",
+    "%": "percent",
+    "1": "unitless",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_unit_registry() -> pint.UnitRegistry:
+    # Building a UnitRegistry parses pint's entire units definition file, which is far
+    # more expensive than the conversion itself, so a single registry is shared by all
+    # conversions.
+    ureg = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+    ureg.define("fraction = []")  # type: ignore
+    ureg.define("unitless = []")  # type: ignore
+    return ureg
+
+
+@lru_cache(maxsize=128)
+def _get_linear_conversion(
+    in_units: str, out_units: str
+) -> Optional[Tuple[float, float]]:
+    # Most unit conversions are affine (out = in * scale + offset), so the coefficients
+    # can be resolved through pint once per pair of units and then applied directly to
+    # the data with numpy. Returns None for non-affine conversions (e.g., logarithmic
+    # units), which must go through pint.
+    ureg = _get_unit_registry()
+
+    def convert(value: float) -> float:
+        return float((value * ureg(in_units)).to(out_units).magnitude)  # type: ignore
+
+    offset = convert(0.0)
+    scale = convert(1.0) - offset
+    for value in (-7.5, 1000.0):
+        if not np.isclose(convert(value), value * scale + offset, rtol=1e-9):
+            return None
+    return scale, offset
+
+
+def _convert_units(data: Any, in_units: str, out_units: str) -> NDArray[Any]:
+    """---------------------------------------------------------------------------------
+    Converts data from the input units to the output units using pint.
+
+    Equivalent to act.utils.data_utils.convert_units, except that the pint UnitRegistry
+    is created once and reused rather than being rebuilt on every call, and affine
+    conversions are applied to the data as a vectorized scale and offset. Integer data
+    are converted back to their original dtype if no precision would be lost.
+
+    Args:
+        data (Any): The data to convert.
+        in_units (str): The units of the input data.
+        out_units (str): The units to convert the data to.
+
+    Returns:
+        NDArray[Any]: The converted data.
+
+    ---------------------------------------------------------------------------------"""
+    in_units = _UNIT_ALIASES.get(in_units, in_units)
+    out_units = _UNIT_ALIASES.get(out_units, out_units)
+    if in_units == out_units:
+        return data
+
+    if not isinstance(data, np.ndarray):
+        data = np.array(data)
+    dtype = data.dtype
+
+    converted: NDArray[Any]
+    if (coefficients := _get_linear_conversion(in_units, out_units)) is not None:
+        scale, offset = coefficients
+        converted = data * scale
+        if offset:
+            converted += offset  # in-place to avoid a second temporary array
+    else:
+        ureg = _get_unit_registry()
+        quantity = data * ureg(in_units)  # type: ignore
+        converted = quantity.to(out_units).magnitude  # type: ignore
+
+    if (
+        dtype.kind == "i"
+        and np.nanmin(converted) >= np.iinfo(dtype).min
+        and np.nanmax(converted) <= np.iinfo(dtype).max
+        and np.all(np.mod(converted, 1) == 0)
+    ):
+        converted = converted.astype(dtype)
+    return converted
+
 
 class UnitsConverter(DataConverter):
     """---------------------------------------------------------------------------------
@@ -86,7 +176,7 @@ class UnitsConverter(DataConverter):
                 )
             return None
 
-        converted: NDArray[Any] = act.utils.data_utils.convert_units(  # type: ignore
+        converted = _convert_units(
             data=data.data,
             in_units=input_units,
             out_units=output_units,
@@ -102,12 +192,7 @@ class UnitsConverter(DataConverter):
         return data_array
 
     def _get_input_units(self, data: xr.DataArray) -> str:
-        units = ""
-        if self.input_units:
-            units = self.input_units
-        elif "units" in data.attrs:
-            units = data.attrs["units"]
-        return units
+        return self.input_units or data.attrs.get("units", "")
 
 
 class StringToDatetime(DataConverter):
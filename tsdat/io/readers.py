@@ -174,9 +174,10 @@ class TarReader(ArchiveReader):
 
         tar = tarfile.open(fileobj=fileobj, **self.parameters.read_tar_kwargs)  # type: ignore
 
+        exclude = re.compile(self.parameters.exclude)  # type: ignore
         for info_obj in tar:  # type: ignore
             filename = info_obj.name  # type: ignore
-            if re.match(self.parameters.exclude, filename):  # type: ignore
+            if exclude.match(filename):
                 continue
 
             for key in self.parameters.readers.keys():
@@ -277,12 +278,14 @@ class ZipReader(ArchiveReader):
 
         zip = ZipFile(file=fileobj, **self.parameters.read_zip_kwargs)  # type: ignore
 
+        exclude = re.compile(self.parameters.exclude)  # type: ignore
+        patterns = {key: re.compile(key) for key in self.parameters.readers.keys()}
         for filename in zip.namelist():
-            if re.match(self.parameters.exclude, filename):  # type: ignore
+            if exclude.match(filename):
                 continue
 
-            for key in self.parameters.readers.keys():
-                if not re.match(key, filename):
+            for key, pattern in patterns.items():
+                if not pattern.match(filename):
                     continue
                 reader: DataReader = self.parameters.readers.get(key, None)
                 if reader:
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import logging
 import re
@@ -153,6 +154,13 @@ class DefaultRetriever(Retriever):
         input keys are provided simultaneously, or if any registered DataReader objects
         could return a dataset mapping instead of a single dataset."""
 
+        max_workers: int = Field(1, ge=1)
+        """The maximum number of threads used to read input keys concurrently. Defaults
+        to 1, which reads inputs one at a time. Larger values can reduce retrieval times
+        when many inputs are provided at once and the DataReaders are I/O-bound (e.g.,
+        reading from network filesystems). DataReaders must be thread-safe to use this
+        option."""
+
         # IDEA: option to disable retrieval of input attrs
         # retain_global_attrs: bool = True
         # retain_variable_attrs: bool = True
@@ -182,13 +190,26 @@ class DefaultRetriever(Retriever):
         return output_dataset
 
     def _get_raw_mapping(self, input_keys: List[str]) -> Dict[str, xr.Dataset]:
-        dataset_mapping: Dict[str, xr.Dataset] = {}
-        input_reader_mapping = self._match_inputs(input_keys)
-        for input_key, reader in input_reader_mapping.items():  # IDEA: async
+        def read(input_key: str, reader: DataReader) -> Dict[str, xr.Dataset]:
             logger.debug("Using %s to read input_key '%s'", reader, input_key)
             data = reader.read(input_key)
             if isinstance(data, xr.Dataset):
                 data = {input_key: data}
+            return data
+
+        input_reader_mapping = self._match_inputs(input_keys)
+        keys, readers = list(input_reader_mapping), list(input_reader_mapping.values())
+        max_workers = min(self.parameters.max_workers, len(keys))
+        if max_workers > 1:
+            # Results are collected in input order so the merged output is the same as
+            # when inputs are read sequentially.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(read, keys, readers))
+        else:
+            results = [read(key, reader) for key, reader in zip(keys, readers)]
+
+        dataset_mapping: Dict[str, xr.Dataset] = {}
+        for data in results:
             dataset_mapping.update(data)
         return dataset_mapping
 
@@ -555,7 +576,8 @@ class StorageRetriever(Retriever):
 
         ------------------------------------------------------------------------------------
         """
-        assert storage is not None, "Missing required 'storage' parameter."
+        if storage is None:
+            raise ValueError("Missing required 'storage' parameter.")
 
         storage_input_keys = [StorageRetrieverInput(key) for key in input_keys]
 
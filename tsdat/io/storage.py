@@ -2,9 +2,11 @@ import logging
 import re
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
+from threading import get_ident
 from time import time
 from typing import Any, Dict, Iterable, List, Tuple, Union
 
@@ -16,6 +18,7 @@ from ..utils import (
     get_fields_from_dataset,
     get_fields_from_datastream,
     get_file_datetime_str,
+    iter_files,
 )
 from .base import Storage
 from .handlers import FileHandler, NetCDFHandler, ZarrHandler
@@ -204,12 +207,11 @@ class FileSystem(Storage):
         start_date_str = start.strftime("%Y%m%d.%H%M%S")
         end_date_str = end.strftime("%Y%m%d.%H%M%S")
 
-        valid_filepaths: List[Path] = []
-        for filepath in filepaths:
-            file_date_str = get_file_datetime_str(filepath)
-            if start_date_str <= file_date_str <= end_date_str:
-                valid_filepaths.append(filepath)
-        return valid_filepaths
+        return [
+            filepath
+            for filepath in filepaths
+            if start_date_str <= get_file_datetime_str(filepath) <= end_date_str
+        ]
 
     def _open_data_files(self, *filepaths: Path) -> List[xr.Dataset]:
         dataset_list: List[xr.Dataset] = []
@@ -248,6 +250,61 @@ class FileSystem(Storage):
         return Path(resolved), "*"
 
 
+@lru_cache()
+def _get_bucket(region: str, bucket: str, timehash: int = 0, thread_id: int = 0):
+    """---------------------------------------------------------------------------------
+    Creates a boto3 Bucket resource or returns an existing one.
+
+    boto3 sessions and resources are not thread-safe, so each thread gets its own
+    Bucket resource built from its own Session.
+
+    Args:
+        region (str): The bucket region.
+        bucket (str): The name of the bucket.
+        timehash (int, optional): A time hash used to cache repeated calls to this
+            function. Bucket resources are rebuilt from a fresh session whenever the
+            time hash changes.
+        thread_id (int, optional): The identifier of the calling thread, e.g., from
+            threading.get_ident().
+
+    Returns:
+        An s3.Bucket resource for the bucket.
+
+    ---------------------------------------------------------------------------------"""
+    import boto3
+
+    del timehash, thread_id
+    session = boto3.session.Session(region_name=region)
+    s3 = session.resource("s3", region_name=region)  # type: ignore
+    return s3.Bucket(name=bucket)
+
+
+@lru_cache()
+def _get_session(region: str, timehash: int = 0):
+    """---------------------------------------------------------------------------------
+    Creates a boto3 Session or returns an active one.
+
+    Borrowed approximately from https://stackoverflow.com/a/55900800/15641512.
+
+    Args:
+        region (str): The session region.
+        timehash (int, optional): A time hash used to cache repeated calls to this
+            function. This should be generated using tsdat.io.storage._get_timehash().
+
+    Returns:
+        boto3.session.Session: An active boto3 Session object.
+
+    ---------------------------------------------------------------------------------"""
+    import boto3
+
+    del timehash
+    return boto3.session.Session(region_name=region)
+
+
+def _get_timehash(seconds: int = 3600) -> int:
+    return round(time() / seconds)
+
+
 class FileSystemS3(FileSystem):
     """Handles data storage and retrieval for file-based data in an AWS S3 bucket.
 
@@ -283,6 +340,10 @@ class FileSystemS3(FileSystem):
         
         Defaults to ``us-west-2``."""
 
+        max_upload_workers: int = Field(8, ge=1)
+        """The maximum number of threads used to upload ancillary files saved with the
+        ``uploadable_dir()`` context manager. Defaults to 8."""
+
         @validator("storage_root")
         def _ensure_storage_root_exists(cls, storage_root: Path) -> Path:
             return storage_root  # HACK: Don't run parent validator to create storage root file
@@ -293,9 +354,7 @@ class FileSystemS3(FileSystem):
     def _check_authentication(cls, parameters: Parameters):
         import botocore.exceptions
 
-        session = FileSystemS3._get_session(
-            region=parameters.region, timehash=FileSystemS3._get_timehash()
-        )
+        session = _get_session(region=parameters.region, timehash=_get_timehash())
         try:
             session.client("sts").get_caller_identity().get("Account")  # type: ignore
         except botocore.exceptions.ClientError:
@@ -309,9 +368,7 @@ class FileSystemS3(FileSystem):
     def _ensure_bucket_exists(cls, parameters: Parameters):
         import botocore.exceptions
 
-        session = FileSystemS3._get_session(
-            region=parameters.region, timehash=FileSystemS3._get_timehash()
-        )
+        session = _get_session(region=parameters.region, timehash=_get_timehash())
         s3 = session.resource("s3", region_name=parameters.region)  # type: ignore
         try:
             s3.meta.client.head_bucket(Bucket=parameters.bucket)
@@ -322,42 +379,20 @@ class FileSystemS3(FileSystem):
 
     @property
     def _session(self):
-        return FileSystemS3._get_session(
-            region=self.parameters.region, timehash=FileSystemS3._get_timehash()
-        )
+        return _get_session(region=self.parameters.region, timehash=_get_timehash())
 
-    # TODO: use cachetools.func.ttl_cache() so we don't create lots of bucket resources
     @property
     def _bucket(self):
-        s3 = self._session.resource("s3", region_name=self.parameters.region)  # type: ignore
-        return s3.Bucket(name=self.parameters.bucket)
-
-    @staticmethod
-    @lru_cache()
-    def _get_session(region: str, timehash: int = 0):
-        """------------------------------------------------------------------------------------
-        Creates a boto3 Session or returns an active one.
-
-        Borrowed approximately from https://stackoverflow.com/a/55900800/15641512.
-
-        Args:
-            region (str): The session region.
-            timehash (int, optional): A time hash used to cache repeated calls to this
-                function. This should be generated using tsdat.io.storage.get_timehash().
-
-        Returns:
-            boto3.session.Session: An active boto3 Session object.
-
-        ------------------------------------------------------------------------------------
-        """
-        import boto3
-
-        del timehash
-        return boto3.session.Session(region_name=region)
+        return _get_bucket(
+            region=self.parameters.region,
+            bucket=self.parameters.bucket,
+            timehash=_get_timehash(),
+            thread_id=get_ident(),
+        )
 
-    @staticmethod
-    def _get_timehash(seconds: int = 3600) -> int:
-        return round(time() / seconds)
+    # Class-level aliases kept for backwards compatibility
+    _get_session = staticmethod(_get_session)
+    _get_timehash = staticmethod(_get_timehash)
 
     def last_modified(self, datastream: str) -> Union[datetime, None]:
         """Returns the datetime of the last modification to the datastream's storage area."""
@@ -406,15 +441,33 @@ class FileSystemS3(FileSystem):
         self._bucket.upload_file(Filename=str(filepath), Key=target_path.as_posix())
         logger.info("Saved ancillary file to: %s", target_path.as_posix())
 
+    def save_ancillary_files(self, filepaths: Dict[Path, Path]):
+        """Uploads several ancillary files to the storage bucket concurrently.
+
+        Args:
+            filepaths (Dict[Path, Path]): A mapping of paths to ancillary files to the
+                target paths where they should be saved in the bucket.
+        """
+        if len(filepaths) < 2:
+            return super().save_ancillary_files(filepaths)
+
+        max_workers = min(self.parameters.max_upload_workers, len(filepaths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                # Each worker thread gets its own Bucket resource, see _get_bucket()
+                executor.submit(self.save_ancillary_file, filepath, target_path)
+                for filepath, target_path in filepaths.items()
+            ]
+            for future in futures:
+                future.result()  # re-raise any upload errors
+
     def save_data(self, dataset: xr.Dataset, **kwargs: Any):
         datastream: str = dataset.attrs["datastream"]
         standard_fpath = self._get_dataset_filepath(dataset)
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_filepath = Path(tmp_dir) / standard_fpath.name
             self.handler.writer.write(dataset, tmp_filepath)
-            for filepath in Path(tmp_dir).glob("**/*"):
-                if filepath.is_dir():
-                    continue
+            for filepath in iter_files(tmp_dir):
                 s3_key = (
                     standard_fpath.parent / filepath.relative_to(tmp_dir)
                 ).as_posix()
@@ -449,10 +502,10 @@ class FileSystemS3(FileSystem):
         )
         dirpath, pattern = self._extract_time_substitutions(semi_resolved, start, end)
         dirpath = self.parameters.storage_root / dirpath
-        pattern = pattern.replace("*", ".*")
+        regex = re.compile(pattern.replace("*", ".*"))
 
         objects = self._bucket.objects.filter(Prefix=dirpath.as_posix())
-        filepaths = (Path(p.key) for p in objects if re.search(pattern, p.key))
+        filepaths = (Path(p.key) for p in objects if regex.search(p.key))
         return self._filter_between_dates(filepaths, start, end)
 
     def _open_data_files(self, *filepaths: Path) -> List[xr.Dataset]:
@@ -3,7 +3,7 @@ import warnings
 import numpy as np
 import pandas as pd
 import xarray as xr
-from typing import Any, Dict, Iterable, List, Optional, cast, Hashable
+from typing import Any, Dict, List, Optional, cast, Hashable
 from pathlib import Path
 from pydantic import BaseModel, Extra, Field
 from .base import FileWriter
@@ -51,26 +51,24 @@ class NetCDFWriter(FileWriter):
         encoding_dict: Dict[str, Dict[str, Any]] = {}
         to_netcdf_kwargs["encoding"] = encoding_dict
 
-        for variable_name in cast(Iterable[str], dataset.variables):
+        variables = cast(Dict[str, xr.Variable], dataset.variables)
+        for variable_name, variable in variables.items():
             # Encoding options: https://unidata.github.io/netcdf4-python/#Dataset.createVariable
             # For some reason contiguous=True and chunksizes=None is incompatible with compression
-            if hasattr(dataset[variable_name], "encoding"):
-                if "contiguous" in dataset[variable_name].encoding:
-                    dataset[variable_name].encoding.pop("contiguous")
-                if "chunksizes" in dataset[variable_name].encoding:
-                    dataset[variable_name].encoding.pop("chunksizes")
+            variable.encoding.pop("contiguous", None)
+            variable.encoding.pop("chunksizes", None)
 
             # Prevent Xarray from setting 'nan' as the default _FillValue
-            encoding_dict[variable_name] = dataset[variable_name].encoding.copy()  # type: ignore
+            encoding_dict[variable_name] = variable.encoding.copy()  # type: ignore
             if (
                 "_FillValue" not in encoding_dict[variable_name]
-                and "_FillValue" not in dataset[variable_name].attrs
+                and "_FillValue" not in variable.attrs
             ):
                 encoding_dict[variable_name]["_FillValue"] = None
 
             if self.parameters.compression_level:
                 # Handle str dtypes: https://github.com/pydata/xarray/issues/2040
-                if dataset[variable_name].dtype.kind == "U":
+                if variable.dtype.kind == "U":
                     encoding_dict[variable_name]["dtype"] = "S1"
 
                 encoding_dict[variable_name].update(
@@ -116,18 +114,19 @@ class SplitNetCDFWriter(NetCDFWriter):
         encoding_dict: Dict[str, Dict[str, Any]] = {}
         to_netcdf_kwargs["encoding"] = encoding_dict
 
-        for variable_name in cast(Iterable[str], dataset.variables):
+        variables = cast(Dict[str, xr.Variable], dataset.variables)
+        for variable_name, variable in variables.items():
             # Prevent Xarray from setting 'nan' as the default _FillValue
-            encoding_dict[variable_name] = dataset[variable_name].encoding  # type: ignore
+            encoding_dict[variable_name] = variable.encoding  # type: ignore
             if (
                 "_FillValue" not in encoding_dict[variable_name]
-                and "_FillValue" not in dataset[variable_name].attrs
+                and "_FillValue" not in variable.attrs
             ):
                 encoding_dict[variable_name]["_FillValue"] = None
 
             if self.parameters.compression_level:
                 # Handle str dtypes: https://github.com/pydata/xarray/issues/2040
-                if dataset[variable_name].dtype.kind == "U":
+                if variable.dtype.kind == "U":
                     encoding_dict[variable_name]["dtype"] = "S1"
 
                 encoding_dict[variable_name].update(
@@ -141,13 +140,16 @@ class SplitNetCDFWriter(NetCDFWriter):
             if "chunksizes" in encoding_dict[variable_name]:
                 del encoding_dict[variable_name]["chunksizes"]
 
-        interval = self.parameters.time_interval
-        unit = self.parameters.time_unit
+        interval = np.timedelta64(
+            self.parameters.time_interval, self.parameters.time_unit
+        )
 
-        t1 = dataset.time[0]
-        t2 = t1 + np.timedelta64(interval, unit)
+        # Work with numpy scalars so each iteration doesn't index or compare DataArrays
+        time_data = dataset["time"].data
+        t1, end = time_data[0], time_data[-1]
+        t2 = t1 + interval
 
-        while t1 < dataset.time[-1]:
+        while t1 < end:
             ds_temp = dataset.sel(time=slice(t1, t2))
 
             new_filename = get_filename(ds_temp, self.file_extension)
@@ -156,7 +158,7 @@ class SplitNetCDFWriter(NetCDFWriter):
             ds_temp.to_netcdf(new_filepath, **to_netcdf_kwargs)  # type: ignore
 
             t1 = t2
-            t2 = t1 + np.timedelta64(interval, unit)
+            t2 = t1 + interval
 
 
 class CSVWriter(FileWriter):
@@ -183,10 +185,10 @@ class CSVWriter(FileWriter):
         d2: List[Hashable] = []
         d2_coord: List[Hashable] = [v for v in dataset.coords if v != "time"]
         for var in dataset:
-            shp = dataset[var].shape
-            if len(shp) <= 1:
+            ndim = dataset.variables[var].ndim
+            if ndim <= 1:
                 d1.append(var)
-            elif len(shp) == 2:
+            elif ndim == 2:
                 d2.append(var)
             else:
                 warnings.warn(
@@ -204,7 +206,7 @@ class CSVWriter(FileWriter):
         metadata_filepath = filepath.with_suffix(".attrs.csv")  # type: ignore
         var_metadata: List[Dict[str, Any]] = []
         for var in dataset:
-            attrs = dataset[var].attrs
+            attrs = dataset.variables[var].attrs
             attrs.update({"name": var})
             var_metadata.append(attrs)
         df_metadata = pd.DataFrame(var_metadata)
@@ -281,12 +283,13 @@ class ZarrWriter(FileWriter):
         self, dataset: xr.Dataset, filepath: Optional[Path] = None, **kwargs: Any
     ) -> None:
         encoding_dict: Dict[str, Dict[str, Any]] = {}
-        for variable_name in cast(Iterable[str], dataset.variables):
+        variables = cast(Dict[str, xr.Variable], dataset.variables)
+        for variable_name, variable in variables.items():
             # Prevent Xarray from setting 'nan' as the default _FillValue
-            encoding_dict[variable_name] = dataset[variable_name].encoding  # type: ignore
+            encoding_dict[variable_name] = variable.encoding  # type: ignore
             if (
                 "_FillValue" not in encoding_dict[variable_name]
-                and "_FillValue" not in dataset[variable_name].attrs
+                and "_FillValue" not in variable.attrs
             ):
                 encoding_dict[variable_name]["_FillValue"] = None
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 import numpy as np
 import xarray as xr
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from getpass import getuser
 from datetime import datetime
-from typing import Any, Iterable, List, Pattern, cast
+from time import time
+from typing import Any, Iterable, List, Mapping, Pattern, cast
 from pydantic import Field
 from ..config.dataset import DatasetConfig
 from ..io.base import Retriever, Storage
@@ -15,6 +17,13 @@ from ..utils import ParameterizedClass, model_to_dict
 __all__ = ["Pipeline"]
 
 
+@lru_cache(maxsize=1)
+def _get_history(timestamp: int) -> str:
+    # History only needs second resolution, so runs that finish within the same second
+    # share one formatted string.
+    return f"Ran by {getuser()} at {datetime.fromtimestamp(timestamp).isoformat()}"
+
+
 class Pipeline(ParameterizedClass, ABC):
     """------------------------------------------------------------------------------------
     Base class for tsdat data pipelines.
@@ -70,8 +79,11 @@ class Pipeline(ParameterizedClass, ABC):
         output_vars = list(self.dataset_config.coords) + list(
             self.dataset_config.data_vars
         )
-        retrieved_variables = cast(List[str], list(dataset.variables))
-        vars_to_drop = [ret for ret in retrieved_variables if ret not in output_vars]
+        # Use hashed lookups on both sides; membership tests against the lists are
+        # O(n) each, making the comparison quadratic in the number of variables.
+        output_var_set = set(output_vars)
+        retrieved_variables = cast(Mapping[str, Any], dataset.variables)
+        vars_to_drop = [ret for ret in retrieved_variables if ret not in output_var_set]
         vars_to_add = [out for out in output_vars if out not in retrieved_variables]
 
         dataset = dataset.drop_vars(vars_to_drop)
@@ -85,13 +97,14 @@ class Pipeline(ParameterizedClass, ABC):
         self, dataset: xr.Dataset, vars_to_add: Iterable[str]
     ) -> xr.Dataset:
         for name in vars_to_add:
-            dims = self.dataset_config[name].dims
-            dtype = self.dataset_config[name].dtype
-            data = self.dataset_config[name].data
+            var_config = self.dataset_config[name]
+            dims = var_config.dims
+            dtype = var_config.dtype
+            data = var_config.data
 
             if data is None:
-                fill_value = self.dataset_config[name].attrs.fill_value
-                shape = tuple(len(dataset[d]) for d in dims)
+                fill_value = var_config.attrs.fill_value
+                shape = tuple(dataset.sizes[d] for d in dims)
                 data = np.full(shape=shape, fill_value=fill_value, dtype=dtype)  # type: ignore
             else:
                 # cast to specified data type. Note that np.array preserves scalars
@@ -110,13 +123,12 @@ class Pipeline(ParameterizedClass, ABC):
         self, dataset: xr.Dataset, output_vars: Iterable[str]
     ) -> xr.Dataset:
         global_attrs = model_to_dict(self.dataset_config.attrs)
-        dataset.attrs.update(**global_attrs)
+        global_attrs["history"] = _get_history(int(time()))
+        dataset.attrs.update(global_attrs)
 
+        variables = dataset.variables
         for name in output_vars:
             var_attrs = model_to_dict(self.dataset_config[name].attrs)
-            dataset[name].attrs.update(var_attrs)
-
-        history = f"Ran by {getuser()} at {datetime.now().isoformat()}"
-        dataset.attrs["history"] = history
+            variables[name].attrs.update(var_attrs)
 
         return dataset
@@ -131,13 +131,14 @@ class QualityManager(BaseModel, extra=Extra.forbid):
             else:
                 variables.append(key)
 
-        return [v for v in variables if v not in self.exclude]
+        exclude = set(self.exclude)
+        return [v for v in variables if v not in exclude]
 
     def _get_dataset_coords(self, dataset: xr.Dataset) -> List[str]:
         return list(dataset.coords)
 
     def _get_dataset_data_vars(self, dataset: xr.Dataset) -> List[str]:
-        return [str(v) for v in dataset.data_vars if not str(v).startswith("qc_")]
+        return [v for v in map(str, dataset.data_vars) if not v.startswith("qc_")]
 
 
 class QualityManagement(BaseModel, extra=Extra.forbid):
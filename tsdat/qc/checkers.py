@@ -44,15 +44,16 @@ class CheckMissing(QualityChecker):
     ---------------------------------------------------------------------------------"""
 
     def run(self, dataset: xr.Dataset, variable_name: str) -> NDArray[np.bool_]:
-        results: NDArray[np.bool_] = dataset[variable_name].isnull().data
+        variable = dataset[variable_name]
+        results: NDArray[np.bool_] = variable.isnull().data
 
-        if "_FillValue" in dataset[variable_name].attrs:
-            fill_value = dataset[variable_name].attrs["_FillValue"]
-            results |= dataset[variable_name].data == fill_value
+        if "_FillValue" in variable.attrs:
+            fill_value = variable.attrs["_FillValue"]
+            results |= variable.data == fill_value
 
-        elif np.issubdtype(dataset[variable_name].data.dtype, str):  # type: ignore
+        elif np.issubdtype(variable.data.dtype, str):  # type: ignore
             fill_value = ""
-            results |= dataset[variable_name].data == fill_value
+            results |= variable.data == fill_value
 
         return results
 
@@ -128,13 +129,17 @@ class CheckMonotonic(QualityChecker):
         # Find all the values where things break, not just those flagged by diff
         # if any(failures) and not all(failures):
         if len(variable.shape) == 1:
-            prev = variable.values[0]
-            for i, value in enumerate(variable.values[1:]):
-                success = value < prev if direction == "decreasing" else value > prev
-                if success:
-                    prev = value  # only update prev on success
-                else:
-                    failures[i + 1] = True
+            # Each value is compared against the last value that passed, which is
+            # always the running max (increasing) or min (decreasing) of the preceding
+            # values. fmax/fmin skip NaN/NaT values, which can never pass, except for a
+            # leading one, which causes every following value to fail.
+            values = variable.values
+            if direction == "decreasing":
+                failures[1:] = ~(values[1:] < np.fmin.accumulate(values[:-1]))
+            else:
+                failures[1:] = ~(values[1:] > np.fmax.accumulate(values[:-1]))
+            if values.size and values[0] != values[0]:  # NaN/NaT are not equal to self
+                failures[1:] = True
         else:
             # 2D diff isn't as clever with failing indexes; just report all individual
             # points that fail
@@ -172,11 +177,12 @@ class _ThresholdChecker(QualityChecker):
     def _get_threshold(
         self, dataset: xr.Dataset, variable_name: str, min_: bool
     ) -> Union[float, None]:
-        threshold = dataset[variable_name].attrs.get(self.attribute_name, None)
-        if threshold is not None:
-            if isinstance(threshold, list):
-                index = 0 if min_ else -1
-                threshold = threshold[index]
+        attrs = dataset.variables[variable_name].attrs
+        threshold = attrs.get(self.attribute_name, None)
+        # Range attributes may be lists or, if read from a file, numpy arrays
+        if threshold is not None and np.ndim(threshold) > 0:
+            index = 0 if min_ else -1
+            threshold = np.ravel(threshold)[index]
         return threshold
 
 
@@ -203,17 +209,16 @@ class _CheckMin(_ThresholdChecker):
     def run(
         self, dataset: xr.Dataset, variable_name: str
     ) -> Union[NDArray[np.bool_], None]:
-        var_data = dataset[variable_name]
-        failures: NDArray[np.bool_] = np.zeros_like(var_data, dtype=np.bool_)  # type: ignore
-
         min_value = self._get_threshold(dataset, variable_name, min_=True)
         if min_value is None:
             return None
 
+        var_data = dataset.variables[variable_name].data
+        failures: NDArray[np.bool_]
         if self.allow_equal:
-            failures = np.less(var_data.data, min_value)
+            failures = np.less(var_data, min_value)
         else:
-            failures = np.less_equal(var_data.data, min_value)
+            failures = np.less_equal(var_data, min_value)
 
         return failures
 
@@ -241,17 +246,16 @@ class _CheckMax(_ThresholdChecker):
     def run(
         self, dataset: xr.Dataset, variable_name: str
     ) -> Union[NDArray[np.bool_], None]:
-        var_data = dataset[variable_name]
-        failures: NDArray[np.bool_] = np.zeros_like(var_data, dtype=np.bool_)  # type: ignore
-
         max_value = self._get_threshold(dataset, variable_name, min_=False)
         if max_value is None:
             return None
 
+        var_data = dataset.variables[variable_name].data
+        failures: NDArray[np.bool_]
         if self.allow_equal:
-            failures = np.greater(var_data.data, max_value)
+            failures = np.greater(var_data, max_value)
         else:
-            failures = np.greater_equal(var_data.data, max_value)
+            failures = np.greater_equal(var_data, max_value)
 
         return failures
 
@@ -1,6 +1,7 @@
 import warnings
 from typing import Any, Dict, List, Literal, Optional, Union
 
+import act  # type: ignore  # noqa: F401 (registers the xarray 'qcfilter' accessor)
 import numpy as np
 import xarray as xr
 from numpy.typing import NDArray
@@ -68,18 +69,18 @@ class FailPipeline(QualityHandler):
             # message will be bloated and hard to read. Note that np.nonzero(failures)
             # returns a hard-to-read tuple of indexes, so we modify that to be easier to
             # read and show the first self.parameters.display_limit # of errors.
+            limit = self.parameters.display_limit
             failed_where = np.nonzero(failures)  # type: ignore
-            failed_values = list(dataset[variable_name].values[failed_where][: self.parameters.display_limit])  # type: ignore
+            failed_values = dataset[variable_name].values[failed_where][:limit]
+            if failed_values.dtype.kind not in "mM":  # ns datetimes .tolist() to ints
+                failed_values = failed_values.tolist()
+            else:
+                failed_values = list(failed_values)
             failed_indexes: Union[List[int], List[List[int]]]
             if len(failed_where) == 1:  # 1D
-                failed_indexes = list(failed_where[0][: self.parameters.display_limit])
+                failed_indexes = failed_where[0][:limit].tolist()
             else:
-                failed_indexes = [
-                    [dim_idxs[i] for dim_idxs in failed_where]
-                    for i in range(
-                        min(self.parameters.display_limit, len(failed_where[0]))
-                    )
-                ]
+                failed_indexes = np.transpose(failed_where)[:limit].tolist()
             msg += (
                 f"The first failures occur at indexes: {failed_indexes}. The"
                 f" corresponding values are: {failed_values}.\n"
@@ -175,14 +176,13 @@ class RemoveFailedValues(QualityHandler):
         self, dataset: xr.Dataset, variable_name: str, failures: NDArray[np.bool_]
     ) -> xr.Dataset:
         if failures.any():
+            variable = dataset[variable_name]
             if variable_name in dataset.dims:
-                mask = xr.DataArray(
-                    failures, coords={variable_name: dataset[variable_name]}
-                )
+                mask = xr.DataArray(failures, coords={variable_name: variable})
                 dataset = dataset.where(~mask, drop=True)
             else:
-                fill_value = dataset[variable_name].attrs.get("_FillValue", None)
-                dataset[variable_name] = dataset[variable_name].where(~failures, fill_value)  # type: ignore
+                fill_value = variable.attrs.get("_FillValue", None)
+                dataset[variable_name] = variable.where(~failures, fill_value)  # type: ignore
         return dataset
 
 
@@ -794,8 +794,10 @@ class AdiTransformer:
         dsproc.set_sample_timevals(adi_var, 0, timevals)
 
     def _convert_time_data(self, xr_array: xr.DataArray) -> np.ndarray:
-        # astype will produce nanosecond precision, so we have to convert to seconds
-        timevals = xr_array.data.astype("float") / 1000000000
+        # Normalize to nanosecond precision first since newer versions of xarray/pandas
+        # may store datetimes at other resolutions, then convert to seconds in one pass
+        nanoseconds = xr_array.data.astype("datetime64[ns]", copy=False).view(np.int64)
+        timevals = nanoseconds / 1e9
 
         # We have to truncate to 6 decimal places so it matches ADI
         timevals = np.around(timevals, 6)
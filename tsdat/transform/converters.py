@@ -41,7 +41,6 @@ def _create_bounds(
     _width = float(width)
 
     if np.issubdtype(coordinate.dtype, np.datetime64):  # type: ignore
-        coord_vals = np.array([np.datetime64(val) for val in coord_vals])
         _width = np.timedelta64(int(_width), units or "s")
 
     if alignment == "LEFT":
@@ -105,11 +104,10 @@ class CreateTimeGrid(DataConverter):
             and retriever is not None
             and retriever.parameters is not None
             and retriever.parameters.trans_params is not None
-            and retriever.parameters.trans_params.select_parameters(input_key)
         ):
             params = retriever.parameters.trans_params.select_parameters(input_key)
-            width = params["width"].get(variable_name)
-            alignment = params["alignment"].get(variable_name)
+            width = params["width"].get(variable_name) if params else None
+            alignment = params["alignment"].get(variable_name) if params else None
             if width is not None and alignment is not None:
                 bounds = _create_bounds(time_grid, alignment=alignment, width=width)
                 retrieved_dataset.data_vars[f"{variable_name}_bound"] = bounds
@@ -139,11 +137,20 @@ class _ADIBaseTransformer(DataConverter):
             )
         data = data.copy()  # prevent object metadata changes accidentally propagating
 
-        assert retriever is not None
-        assert retriever.parameters is not None
-        assert retriever.parameters.trans_params is not None
-        assert input_dataset is not None
-        assert input_key is not None
+        if (
+            retriever is None
+            or retriever.parameters is None
+            or retriever.parameters.trans_params is None
+        ):
+            raise ValueError(
+                f"{self.__repr_name__()} requires a StorageRetriever with"
+                " 'transformation_parameters' configured."
+            )
+        if input_dataset is None or input_key is None:
+            raise ValueError(
+                f"{self.__repr_name__()} requires the 'input_dataset' and 'input_key'"
+                " arguments."
+            )
 
         output_coord_names = dataset_config[variable_name].dims
         input_coord_names = list(data.dims)  # type: ignore
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import re
+from functools import cached_property, lru_cache
 from typing import Callable, Mapping, Match
 
 __all__ = ("Template",)
 
-_SQUARE_BRACKET_REGEX = r"\[(.*?)\]"
-_CURLY_BRACKET_REGEX = r"\{(.*?)\}"
+_SQUARE_BRACKET_REGEX = re.compile(r"\[(.*?)\]")
+_CURLY_BRACKET_REGEX = re.compile(r"\{(.*?)\}")
 
 
 def _substitute(
@@ -79,17 +80,18 @@ def _substitute(
         # make curly substitutions inside of square brackets or remove the whole thing
         # if substitutions cannot be made.
         try:
-            resolved = re.sub(_CURLY_BRACKET_REGEX, _sub_curly, match.group(1))
+            resolved = _CURLY_BRACKET_REGEX.sub(_sub_curly, match.group(1))
             return resolved if resolved != match.group(1) else ""
         except ValueError:
             return ""
 
-    squared = re.sub(_SQUARE_BRACKET_REGEX, _sub_square, template)
-    resolved = re.sub(_CURLY_BRACKET_REGEX, _sub_curly, squared)
+    squared = _SQUARE_BRACKET_REGEX.sub(_sub_square, template)
+    resolved = _CURLY_BRACKET_REGEX.sub(_sub_curly, squared)
 
     return resolved
 
 
+@lru_cache(maxsize=128)
 def _generate_regex(template: str) -> str:
     """Generates a regex pattern which can be used to extract the values substituted
     into a template string.
@@ -231,6 +233,19 @@ def _generate_regex(template: str) -> str:
 #     return regex_pattern
 
 
+@lru_cache(maxsize=128)
+def _is_balanced(template: str) -> bool:
+    """Returns True if the curly and square brackets in the template are balanced."""
+    stack: list[str] = []
+    for char in template:
+        if char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack or char != stack.pop():
+                return False
+    return len(stack) == 0
+
+
 class Template:
     """Python f-string implementation with lazy and optional variable substitutions.
 
@@ -276,16 +291,13 @@ class Template:
     def __str__(self) -> str:
         return self.template
 
+    @cached_property
+    def _pattern(self) -> re.Pattern[str]:
+        return re.compile(self.regex)
+
     @classmethod
     def _is_balanced(cls, template: str):
-        stack: list[str] = []
-        for char in template:
-            if char in "{[":
-                stack.append("}" if char == "{" else "]")
-            elif char in "}]":
-                if not stack or char != stack.pop():
-                    return False
-        return len(stack) == 0
+        return _is_balanced(template)
 
     def substitute(
         self,
@@ -330,7 +342,7 @@ class Template:
             dict[str, str]: A dictionary mapping each matched template variable to its
                 value in the formatted string. Returns None if there are no matches.
         """
-        match = re.match(self.regex, formatted_str)
+        match = self._pattern.match(formatted_str)
         if match:
             return match.groupdict()
         else:
@@ -1,8 +1,9 @@
 from datetime import datetime
 from enum import Enum
+import os
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -39,25 +40,39 @@ FILENAME_TEMPLATE = Template(
     "{datastream}.{start_date}.{start_time}[.{title}].{extension}"
 )
 
+_FILE_DATETIME_REGEX = re.compile(r".*(\d{8}\.\d{6}).*")
+
+
+def _to_datetime(time: Union[datetime, np.datetime64]) -> datetime:
+    # Converting numpy scalars directly is much cheaper than going through pandas. The
+    # sub-microsecond precision lost here is never used by the substitutions.
+    if isinstance(time, datetime):
+        return time
+    if isinstance(time, np.datetime64):
+        return time.astype("datetime64[us]").item()
+    return pd.to_datetime(time)  # type: ignore
+
 
 def datetime_substitutions(
     time: Union[datetime, np.datetime64, None]
 ) -> Dict[str, str]:
     substitutions: Dict[str, str] = {}
     if time is not None:
-        t = pd.to_datetime(time)
+        # Format once as "YYYYmmdd.HHMMSS" and slice out the individual fields
+        date_time = _to_datetime(time).strftime("%Y%m%d.%H%M%S")
+        date, time_str = date_time.split(".")
         substitutions.update(
-            year=t.strftime("%Y"),
-            month=t.strftime("%m"),
-            day=t.strftime("%d"),
-            hour=t.strftime("%H"),
-            minute=t.strftime("%M"),
-            second=t.strftime("%S"),
-            date_time=t.strftime("%Y%m%d.%H%M%S"),
-            date=t.strftime("%Y%m%d"),
-            time=t.strftime("%H%M%S"),
-            start_date=t.strftime("%Y%m%d"),  # included for backwards compatibility
-            start_time=t.strftime("%H%M%S"),  # included for backwards compatibility
+            year=date[:-4],
+            month=date[-4:-2],
+            day=date[-2:],
+            hour=time_str[:2],
+            minute=time_str[2:4],
+            second=time_str[4:],
+            date_time=date_time,
+            date=date,
+            time=time_str,
+            start_date=date,  # included for backwards compatibility
+            start_time=time_str,  # included for backwards compatibility
         )
     return substitutions
 
@@ -135,21 +150,17 @@ def decode_cf(dataset: xr.Dataset) -> xr.Dataset:
             np.issubdtype(variable.data.dtype, np.datetime64)  # type: ignore
             and "units" in variable.attrs
         ):
-            units = variable.attrs["units"]
-            del variable.attrs["units"]
-            variable.encoding["units"] = units  # type: ignore
+            variable.encoding["units"] = variable.attrs.pop("units")  # type: ignore
 
         # If the _FillValue is already encoded, remove it since it can't be overwritten per xarray
-        if "_FillValue" in variable.encoding:  # type: ignore
-            del variable.encoding["_FillValue"]  # type: ignore
+        variable.encoding.pop("_FillValue", None)  # type: ignore
 
     # Leaving the "dtype" entry in the encoding for datetime64 variables causes a crash
     # when saving the dataset. Not fixed by: https://github.com/pydata/xarray/pull/4684
     ds: xr.Dataset = xr.decode_cf(dataset)  # type: ignore
     for variable in ds.variables.values():
         if variable.data.dtype.type == np.datetime64:  # type: ignore
-            if "dtype" in variable.encoding:  # type: ignore
-                del variable.encoding["dtype"]  # type: ignore
+            variable.encoding.pop("dtype", None)  # type: ignore
     return ds
 
 
@@ -250,18 +261,41 @@ def get_start_date_and_time_str(dataset: xr.Dataset) -> Tuple[str, str]:
         Tuple[str, str]: The start date and time as strings like "YYYYmmdd", "HHMMSS".
 
     ---------------------------------------------------------------------------------"""
-    timestamp = get_start_time(dataset)
-    return timestamp.strftime("%Y%m%d"), timestamp.strftime("%H%M%S")
+    date, time = get_start_time(dataset).strftime("%Y%m%d.%H%M%S").split(".")
+    return date, time
 
 
 def get_file_datetime_str(file: Union[Path, str]) -> str:
-    datetime_match = re.match(r".*(\d{8}\.\d{6}).*", Path(file).name)
+    datetime_match = _FILE_DATETIME_REGEX.match(Path(file).name)
     if datetime_match is not None:
         return datetime_match.groups()[0]
     logger.error(f"File {file} does not contain a recognized date string")
     return ""
 
 
+def iter_files(dirpath: Union[Path, str]) -> Iterator[Path]:
+    """---------------------------------------------------------------------------------
+    Recursively yields the paths to all files under the specified directory.
+
+    Equivalent to filtering ``Path(dirpath).glob("**/*")`` with ``Path.is_file()``, but
+    walks the tree with ``os.scandir()`` so the file type is read from the directory
+    entries rather than with an additional stat call per path.
+
+    Args:
+        dirpath (Union[Path, str]): The directory to search.
+
+    Yields:
+        Path: The path to each file in the directory or any of its subdirectories.
+
+    ---------------------------------------------------------------------------------"""
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield Path(entry.path)
+
+
 def get_datastream(**global_attrs: str) -> str:
     return DATASTREAM_TEMPLATE.substitute(global_attrs)
 
@@ -315,9 +349,12 @@ def get_filename(
 
 
 def get_fields_from_dataset(dataset: xr.Dataset) -> Dict[str, Any]:
+    # Index before loading values so lazily-loaded (e.g., dask) time arrays only read
+    # the first element. The [()] unwraps the 0-d array into a np.datetime64 scalar.
+    start: np.datetime64 = dataset["time"][0].values[()]  # type: ignore
     return {
         **dict(dataset.attrs),
-        **datetime_substitutions(dataset.time.values[0]),
+        **datetime_substitutions(start),
     }
 
 